@@ -1,260 +1,312 @@
 import os
-import json
+import time
+import asyncio
+from typing import Awaitable, Callable
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import mcp.server.stdio
 
 API_TOKEN = os.getenv("FRESHRELEASE_API_TOKEN")
+PROJECT_KEY = os.getenv("FRESHRELEASE_PROJECT_KEY")
 BASE_URL = "https://freshworks.freshrelease.com"
 
+_missing = [name for name, value in (("FRESHRELEASE_API_TOKEN", API_TOKEN), ("FRESHRELEASE_PROJECT_KEY", PROJECT_KEY)) if not value]
+if _missing:
+    raise RuntimeError(f"Missing required environment variable(s): {', '.join(_missing)}")
+
 server = Server("freshrelease-mcp-server")
 
-async def make_request(project_key: str, endpoint: str, method: str = "GET", body: dict = None) -> dict:
-    """Make HTTP request to Freshrelease API"""
-    url = f"{BASE_URL}/{project_key}{endpoint}"
-    headers = {
-        "Authorization": f"Token {API_TOKEN}",
-        "Content-Type": "application/json"
-    }
+_HEADERS = {
+    "Authorization": f"Token {API_TOKEN}",
+    "Content-Type": "application/json"
+}
+
+_client = httpx.AsyncClient(
+    base_url=f"{BASE_URL}/{PROJECT_KEY}",
+    http2=True,
+    headers=_HEADERS,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+    timeout=httpx.Timeout(30.0, connect=5.0)
+)
+
+def _dump(obj) -> str:
+    """Serialize an API result as indented JSON text"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+async def _send(endpoint: str, method: str, body: dict = None) -> dict:
+    """Make HTTP request to Freshrelease API over the shared pooled client"""
+    content = orjson.dumps(body) if body is not None else None
+    response = await _client.request(method, endpoint, content=content)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _is_project_path(endpoint: str) -> bool:
+    """Check that endpoint is a path relative to the project base URL"""
+    # An absolute or protocol-relative URL would bypass base_url and send the
+    # API token to another host
+    return endpoint.startswith("/") and not endpoint.startswith("//")
+
+_inflight: dict[str, asyncio.Task] = {}
+
+def _finish_inflight(endpoint: str, task: asyncio.Task) -> None:
+    """Drop a finished shared GET from the in-flight table"""
+    # A write may already have replaced this entry with a newer request
+    if _inflight.get(endpoint) is task:
+        del _inflight[endpoint]
+    # Mark any exception retrieved so it is not logged when every caller was cancelled
+    if not task.cancelled():
+        task.exception()
+
+def _forget_inflight(endpoint: str) -> None:
+    """Stop sharing in-flight GETs that a write to endpoint may have made stale"""
+    # Reads on the written path, beneath it, or on a parent collection
+    path = endpoint.split("?", 1)[0].rstrip("/")
+    for key in list(_inflight):
+        other = key.split("?", 1)[0].rstrip("/")
+        if other == path or other.startswith(path + "/") or path.startswith(other + "/"):
+            del _inflight[key]
+
+async def make_request(endpoint: str, method: str = "GET", body: dict = None) -> dict:
+    """Make HTTP request to Freshrelease API, sharing identical in-flight GETs"""
+    if not _is_project_path(endpoint):
+        raise ValueError(f"Endpoint must be a path starting with a single '/': {endpoint}")
     
-    async with httpx.AsyncClient() as client:
-        if method == "GET":
-            response = await client.get(url, headers=headers)
-        elif method == "POST":
-            response = await client.post(url, headers=headers, json=body)
-        elif method == "PUT":
-            response = await client.put(url, headers=headers, json=body)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
-        
-        response.raise_for_status()
-        return response.json()
+    if method != "GET":
+        try:
+            return await _send(endpoint, method, body)
+        finally:
+            _forget_inflight(endpoint)
+    
+    task = _inflight.get(endpoint)
+    if task is None:
+        # The request runs in its own task so that cancelling any caller,
+        # including the first one, leaves it running for the others
+        task = asyncio.create_task(_send(endpoint, method))
+        _inflight[endpoint] = task
+        task.add_done_callback(lambda t: _finish_inflight(endpoint, t))
+    return await asyncio.shield(task)
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available Freshrelease tools"""
-    return [
-        Tool(
-            name="freshrelease_get_users",
-            description="Get all users in the Freshrelease project with pagination",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "page": {
-                        "type": "number",
-                        "description": "Page number for pagination",
-                        "default": 1
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of users per page",
-                        "default": 30
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="freshrelease_get_statuses",
-            description="Get all statuses in the project",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="freshrelease_get_issue_types",
-            description="Get all issue types available in the project",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="freshrelease_get_issue",
-            description="Get a specific issue by its key (e.g., FBOTS-47941)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., FBOTS-47941)"
-                    }
-                },
-                "required": ["issue_key"]
-            }
-        ),
-        Tool(
-            name="freshrelease_create_issue",
-            description="Create a new issue in Freshrelease",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Issue title"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Issue description"
-                    },
-                    "issue_type_id": {
-                        "type": "string",
-                        "description": "Issue type ID (e.g., '14' for task)"
-                    },
-                    "owner_id": {
-                        "type": "string",
-                        "description": "Owner user ID"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID (e.g., '280')"
-                    },
-                    "custom_fields": {
-                        "type": "object",
-                        "description": "Custom fields as key-value pairs"
-                    }
-                },
-                "required": ["title", "description", "issue_type_id", "owner_id", "project_id"]
-            }
-        ),
-        Tool(
-            name="freshrelease_update_issue",
-            description="Update an existing Freshrelease issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., FBOTS-48937)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Updated issue description"
-                    },
-                    "issue_type_id": {
-                        "type": "string",
-                        "description": "Issue type ID"
-                    },
-                    "custom_fields": {
-                        "type": "object",
-                        "description": "Custom fields to update"
-                    }
-                },
-                "required": ["issue_key"]
-            }
-        ),
-        Tool(
-            name="freshrelease_get_comments",
-            description="Get all comments on a specific issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_id": {
-                        "type": "string",
-                        "description": "Issue ID (numeric, e.g., '2563487')"
-                    }
-                },
-                "required": ["issue_id"]
-            }
-        ),
-        Tool(
-            name="freshrelease_add_comment",
-            description="Add a comment to a specific issue",
-            inputSchema={
+_cache: dict[str, tuple[float, str]] = {}
+
+async def cached_get(endpoint: str, ttl: float = 300) -> str:
+    """GET a rarely-changing endpoint, reusing its serialized result for ttl seconds"""
+    entry = _cache.get(endpoint)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    text = _dump(await make_request(endpoint))
+    _cache[endpoint] = (time.monotonic(), text)
+    return text
+
+# (name, description, {property: (type, description[, default]) or a full schema dict}, required)
+_TOOL_SPECS = [
+    ("freshrelease_get_users", "Get all users in the Freshrelease project with pagination", {
+        "page": ("number", "Page number for pagination", 1),
+        "limit": ("number", "Number of users per page", 30)
+    }, []),
+    ("freshrelease_get_statuses", "Get all statuses in the project", {}, []),
+    ("freshrelease_get_issue_types", "Get all issue types available in the project", {}, []),
+    ("freshrelease_get_issue", "Get a specific issue by its key (e.g., FBOTS-47941)", {
+        "issue_key": ("string", "Issue key (e.g., FBOTS-47941)")
+    }, ["issue_key"]),
+    ("freshrelease_create_issue", "Create a new issue in Freshrelease", {
+        "title": ("string", "Issue title"),
+        "description": ("string", "Issue description"),
+        "issue_type_id": ("string", "Issue type ID (e.g., '14' for task)"),
+        "owner_id": ("string", "Owner user ID"),
+        "project_id": ("string", "Project ID (e.g., '280')"),
+        "custom_fields": ("object", "Custom fields as key-value pairs")
+    }, ["title", "description", "issue_type_id", "owner_id", "project_id"]),
+    ("freshrelease_update_issue", "Update an existing Freshrelease issue", {
+        "issue_key": ("string", "Issue key (e.g., FBOTS-48937)"),
+        "description": ("string", "Updated issue description"),
+        "issue_type_id": ("string", "Issue type ID"),
+        "custom_fields": ("object", "Custom fields to update")
+    }, ["issue_key"]),
+    ("freshrelease_get_comments", "Get all comments on a specific issue", {
+        "issue_id": ("string", "Issue ID (numeric, e.g., '2563487')")
+    }, ["issue_id"]),
+    ("freshrelease_add_comment", "Add a comment to a specific issue", {
+        "issue_id": ("string", "Issue ID (numeric, e.g., '2563487')"),
+        "content": ("string", "Comment content")
+    }, ["issue_id", "content"]),
+    ("freshrelease_bulk_fetch", "Fetch several read-only endpoints concurrently (e.g., /users?page=1, /statuses, /issue_types)", {
+        "requests": {
+            "type": "array",
+            "description": "GET requests to issue in parallel; results are returned in the same order",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "issue_id": {
-                        "type": "string",
-                        "description": "Issue ID (numeric, e.g., '2563487')"
-                    },
-                    "content": {
+                    "endpoint": {
                         "type": "string",
-                        "description": "Comment content"
+                        "description": "Endpoint path relative to the project (e.g., '/statuses')"
                     }
                 },
-                "required": ["issue_id", "content"]
+                "required": ["endpoint"]
             }
-        )
-    ]
+        }
+    }, ["requests"])
+]
+
+def _mk_property(spec) -> dict:
+    """Expand a (type, description[, default]) shorthand into a JSON schema"""
+    if isinstance(spec, dict):
+        return spec
+    prop = {"type": spec[0], "description": spec[1]}
+    if len(spec) > 2:
+        prop["default"] = spec[2]
+    return prop
+
+def _mk_tool(name: str, description: str, properties: dict, required: list[str]) -> Tool:
+    """Build a Tool from a _TOOL_SPECS entry"""
+    schema = {
+        "type": "object",
+        "properties": {key: _mk_property(spec) for key, spec in properties.items()}
+    }
+    if required:
+        schema["required"] = required
+    return Tool(name=name, description=description, inputSchema=schema)
+
+_TOOLS: list[Tool] = [_mk_tool(*spec) for spec in _TOOL_SPECS]
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available Freshrelease tools"""
+    return _TOOLS
+
+# Errors a tool call can hit in normal operation; anything else is a bug and propagates
+_EXPECTED_ERRORS = (KeyError, httpx.HTTPStatusError, httpx.RequestError, httpx.InvalidURL, orjson.JSONDecodeError)
+
+def _error_text(e: Exception) -> str:
+    """Map one of _EXPECTED_ERRORS to the error text returned to the client"""
+    if isinstance(e, KeyError):
+        return f"Error: Missing argument: {e.args[0]}"
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"Error: API {e.response.status_code} {e.response.reason_phrase}"
+    if isinstance(e, orjson.JSONDecodeError):
+        return f"Error: Invalid response: body is not JSON ({e})"
+    if isinstance(e, httpx.InvalidURL):
+        return f"Error: Invalid URL: {e}"
+    return f"Error: Request failed: {type(e).__name__}: {e}"
+
+async def _h_get_users(arguments: dict) -> list[TextContent]:
+    page = arguments.get("page", 1)
+    result = await make_request(f"/users?page={page}")
+    return [TextContent(type="text", text=_dump(result))]
+
+async def _h_get_statuses(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=await cached_get("/statuses"))]
+
+async def _h_get_issue_types(arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=await cached_get("/issue_types"))]
+
+async def _h_get_issue(arguments: dict) -> list[TextContent]:
+    issue_key = arguments["issue_key"]
+    result = await make_request(f"/issues/{issue_key}")
+    return [TextContent(type="text", text=_dump(result))]
+
+async def _h_create_issue(arguments: dict) -> list[TextContent]:
+    body = {
+        "issue": {
+            "title": arguments["title"],
+            "description": arguments["description"],
+            "key": PROJECT_KEY,
+            "issue_type_id": arguments["issue_type_id"],
+            "owner_id": arguments["owner_id"],
+            "project_id": arguments["project_id"],
+            "custom_field": arguments.get("custom_fields", {})
+        }
+    }
+    result = await make_request("/issues", "POST", body)
+    return [TextContent(type="text", text=_dump(result))]
+
+# Tool argument name -> Freshrelease issue field for optional update fields
+_UPDATE_FIELDS = {
+    "description": "description",
+    "issue_type_id": "issue_type_id",
+    "custom_fields": "custom_field"
+}
+
+async def _h_update_issue(arguments: dict) -> list[TextContent]:
+    issue_key = arguments["issue_key"]
+    issue = {"key": issue_key, **{api: arguments[k] for k, api in _UPDATE_FIELDS.items() if k in arguments}}
+    body = {"issue": issue}
+    result = await make_request(f"/issues/{issue_key}", "PUT", body)
+    return [TextContent(type="text", text=_dump(result))]
+
+async def _h_get_comments(arguments: dict) -> list[TextContent]:
+    issue_id = arguments["issue_id"]
+    result = await make_request(f"/issues/{issue_id}/comments")
+    return [TextContent(type="text", text=_dump(result))]
+
+async def _h_add_comment(arguments: dict) -> list[TextContent]:
+    issue_id = arguments["issue_id"]
+    body = {"content": arguments["content"]}
+    result = await make_request(f"/issues/{issue_id}/comments", "POST", body)
+    return [TextContent(type="text", text=_dump(result))]
+
+async def _h_bulk_fetch(arguments: dict) -> list[TextContent]:
+    requests = arguments["requests"]
+    if not isinstance(requests, list) or not all(
+        isinstance(r, dict) and isinstance(r.get("endpoint"), str) and _is_project_path(r["endpoint"])
+        for r in requests
+    ):
+        return [TextContent(type="text", text="Error: Invalid argument: requests must be a list of {\"endpoint\": \"/path\"} objects")]
+    
+    results = await asyncio.gather(
+        *[make_request(r["endpoint"]) for r in requests],
+        return_exceptions=True
+    )
+    contents = []
+    for result in results:
+        if isinstance(result, _EXPECTED_ERRORS):
+            contents.append(TextContent(type="text", text=_error_text(result)))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            contents.append(TextContent(type="text", text=_dump(result)))
+    return contents
+
+_HANDLERS: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {
+    "freshrelease_get_users": _h_get_users,
+    "freshrelease_get_statuses": _h_get_statuses,
+    "freshrelease_get_issue_types": _h_get_issue_types,
+    "freshrelease_get_issue": _h_get_issue,
+    "freshrelease_create_issue": _h_create_issue,
+    "freshrelease_update_issue": _h_update_issue,
+    "freshrelease_get_comments": _h_get_comments,
+    "freshrelease_add_comment": _h_add_comment,
+    "freshrelease_bulk_fetch": _h_bulk_fetch
+}
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls"""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Error: Unknown tool: {name}")]
     try:
-        if name == "freshrelease_get_users":
-            page = arguments.get("page", 1)
-            result = await make_request(f"/users?page={page}")
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_get_statuses":
-            result = await make_request("/statuses")
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_get_issue_types":
-            result = await make_request("/issue_types")
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_get_issue":
-            issue_key = arguments["issue_key"]
-            result = await make_request(f"/issues/{issue_key}")
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_create_issue":
-            body = {
-                "issue": {
-                    "title": arguments["title"],
-                    "description": arguments["description"],
-                    "key": PROJECT_KEY,
-                    "issue_type_id": arguments["issue_type_id"],
-                    "owner_id": arguments["owner_id"],
-                    "project_id": arguments["project_id"],
-                    "custom_field": arguments.get("custom_fields", {})
-                }
-            }
-            result = await make_request("/issues", "POST", body)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_update_issue":
-            issue_key = arguments["issue_key"]
-            body = {"issue": {"key": issue_key}}
-            
-            if "description" in arguments:
-                body["issue"]["description"] = arguments["description"]
-            if "issue_type_id" in arguments:
-                body["issue"]["issue_type_id"] = arguments["issue_type_id"]
-            if "custom_fields" in arguments:
-                body["issue"]["custom_field"] = arguments["custom_fields"]
-            
-            result = await make_request(f"/issues/{issue_key}", "PUT", body)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_get_comments":
-            issue_id = arguments["issue_id"]
-            result = await make_request(f"/issues/{issue_id}/comments")
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "freshrelease_add_comment":
-            issue_id = arguments["issue_id"]
-            body = {"content": arguments["content"]}
-            result = await make_request(f"/issues/{issue_id}/comments", "POST", body)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-    
-    except Exception as e:
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+        return await handler(arguments)
+    except _EXPECTED_ERRORS as e:
+        return [TextContent(type="text", text=_error_text(e))]
 
 async def main():
     """Run the server"""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        await _client.aclose()
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())